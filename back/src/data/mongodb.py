@@ -1,11 +1,29 @@
-import os
+import re
+import time
 from pymongo import MongoClient
 from pymongo.errors import ConnectionFailure, OperationFailure
 from typing import Optional, Dict, Any, List
 from bson.objectid import ObjectId
-from dotenv import load_dotenv
 
-load_dotenv()
+from settings import (
+    MONGODB_URI,
+    MONGODB_DB_NAME,
+    MONGODB_MAX_POOL_SIZE,
+    MONGODB_MIN_POOL_SIZE,
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+)
+
+# Static restaurant information (not in DB). Shared by every call: treat as read-only.
+RESTAURANT_INFO: Dict[str, Any] = {
+    "name": "Les Pieds dans le Plat",
+    "address": "1 Avenue des Champs-Élysées, 75008 Paris, France",
+    "phone": "+33 1 23 45 67 89",
+    "email": "contact@lespiedsdansleplat.fr",
+    "openingHours": "11:00 AM - 01:00 AM",
+    "description": "Un restaurant traditionnel français au cœur de Paris, offrant une cuisine raffinée dans une ambiance chaleureuse.",
+    "website": "https://www.lespiedsdansleplat.fr",
+    "location": {"latitude": 48.8700, "longitude": 2.3050}
+}
 
 class MongoDBManager:
     """
@@ -13,6 +31,9 @@ class MongoDBManager:
     """
     
     _instance = None
+
+    # Seconds a menu/dish/table read is served from memory before MongoDB is queried again
+    MENU_CACHE_TTL = 60
     
     def __new__(cls):
         if cls._instance is None:
@@ -25,25 +46,32 @@ class MongoDBManager:
         self.client = None
         self.db = None
         self.connected = False
+        self._menu_cache: Dict[str, tuple] = {}
         self._connect()
     
     def _connect(self):
         """Establish connection to MongoDB"""
         try:
-            # Get MongoDB connection string from environment variables
-            mongo_uri = os.environ.get("MONGODB_URI", "mongodb://localhost:27017")
-            db_name = os.environ.get("MONGODB_DB_NAME", "Restaurant_DB")
-            
-            # Connect to MongoDB
-            self.client = MongoClient(mongo_uri, serverSelectionTimeoutMS=5000)
+            # Connect to MongoDB (pool options are only passed when set in the environment)
+            pool_options = {
+                "maxPoolSize": MONGODB_MAX_POOL_SIZE,
+                "minPoolSize": MONGODB_MIN_POOL_SIZE,
+                "waitQueueTimeoutMS": MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+            }
+            self.client = MongoClient(
+                MONGODB_URI,
+                serverSelectionTimeoutMS=5000,
+                **{key: value for key, value in pool_options.items() if value is not None},
+            )
             
             # Test the connection
             self.client.server_info()  # This will raise an exception if connection fails
             
             # Get database
-            self.db = self.client[db_name]
+            self.db = self.client[MONGODB_DB_NAME]
             self.connected=True
             print("[SUCCESS] Successfully connected to MongoDB")
+            self._ensure_indexes()
             
         except (ConnectionFailure, OperationFailure) as e:
             print(f"[ERROR] MongoDB connection failed: {e}")
@@ -52,10 +80,32 @@ class MongoDBManager:
             print(f"[ERROR] Unexpected error connecting to MongoDB: {e}")
             self.connected = False
 
+    def _ensure_indexes(self):
+        """Create the indexes backing the sorted/filtered queries (no-op if they already exist)"""
+        try:
+            self.db["Reservation"].create_index([("date_time", 1)])
+            self.db["Reservation"].create_index([("customer_name", 1)])
+        except Exception as e:
+            print(f"[WARNING] Could not create MongoDB indexes: {e}")
+
     def _ensure_connected(self):
         if not self.connected:
             self._connect()
 
+    # ===== Menu Read Cache =====
+    def _get_cached(self, key: str) -> Any:
+        entry = self._menu_cache.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self.MENU_CACHE_TTL:
+            return None
+        return entry[1]
+
+    def _set_cached(self, key: str, value: Any):
+        self._menu_cache[key] = (time.monotonic(), value)
+
+    def invalidate_menu_cache(self):
+        """Drop cached menu/dish/table reads so the next call hits MongoDB"""
+        self._menu_cache.clear()
+
     # ===== Collection Accessors =====
     @property
     def reservations(self):
@@ -148,21 +198,44 @@ class MongoDBManager:
         except Exception as e:
             print(f"Error getting reservations: {e}")
             return []
-        
+
     # ===== Dish Methods =====
     def get_all_dishes(self) -> List[Dict[str, Any]]:
         if self.dishes is None:
             return []
+        cached = self._get_cached("all_dishes")
+        if cached is not None:
+            return cached
         try:
             dishes = list(self.dishes.find())
             for d in dishes:
                 d["_id"] = str(d["_id"])
             
+            self._set_cached("all_dishes", dishes)
             return dishes
         except Exception as e:
             print(f"Error getting dishes: {e}")
             return []
 
+    def search_dishes(self, query: str) -> List[Dict[str, Any]]:
+        """Case-insensitive search on dish name, category, ingredient or allergen type, filtered by MongoDB"""
+        if self.dishes is None:
+            return []
+        try:
+            pattern = {"$regex": re.escape(query.strip()), "$options": "i"}
+            dishes = list(self.dishes.find({"$or": [
+                {"name": pattern},
+                {"category": pattern},
+                {"ingredients.name": pattern},
+                {"ingredients.allergen_type": pattern},
+            ]}))
+            for d in dishes:
+                d["_id"] = str(d["_id"])
+            return dishes
+        except Exception as e:
+            print(f"Error searching dishes: {e}")
+            return []
+
     def get_dish(self, dish_id: str) -> Optional[Dict[str, Any]]:
         if self.dishes is None:
             return None
@@ -178,13 +251,24 @@ class MongoDBManager:
     def get_dishes_by_category(self) -> Dict[str, List[Dict[str, Any]]]:
         if self.dishes is None:
             return {}
+        cached = self._get_cached("dishes_by_category")
+        if cached is not None:
+            return cached
         try:
-            dishes = list(self.dishes.find())
-            categories = {}
-            for dish in dishes:
-                dish["_id"] = str(dish["_id"])
-                cat = dish.get("category", "Other")
-                categories.setdefault(cat, []).append(dish)
+            # Group on the server instead of in Python; every dish is still returned, nested under its category.
+            # $group does not preserve order, so sort categories (and dishes within them) by insertion order.
+            pipeline = [
+                {"$sort": {"_id": 1}},
+                {"$addFields": {"_id": {"$toString": "$_id"}}},
+                {"$group": {
+                    "_id": {"$ifNull": ["$category", "Other"]},
+                    "first_id": {"$min": "$_id"},
+                    "dishes": {"$push": "$$ROOT"},
+                }},
+                {"$sort": {"first_id": 1}},
+            ]
+            categories = {doc["_id"]: doc["dishes"] for doc in self.dishes.aggregate(pipeline)}
+            self._set_cached("dishes_by_category", categories)
             return categories
         except Exception as e:
             print(f"Error getting dishes by category: {e}")
@@ -194,10 +278,14 @@ class MongoDBManager:
     def get_tables(self) -> List[Dict[str, Any]]:
         if self.tables is None:
             return []
+        cached = self._get_cached("tables")
+        if cached is not None:
+            return cached
         try:
             tables = list(self.tables.find())
             for t in tables:
                 t["_id"] = str(t["_id"])
+            self._set_cached("tables", tables)
             return tables
         except Exception as e:
             print(f"Error getting tables: {e}")
@@ -262,10 +350,15 @@ class MongoDBManager:
     def get_menu(self) -> Optional[Dict[str, Any]]:
         if self.menu is None:
             return None
+        cached = self._get_cached("menu")
+        if cached is not None:
+            return cached
         try:
             menu = self.menu.find_one()
             if menu and "_id" in menu:
                 menu["_id"] = str(menu["_id"])
+            if menu is not None:
+                self._set_cached("menu", menu)
             return menu
         except Exception as e:
             print(f"Error getting menu: {e}")
@@ -276,6 +369,7 @@ class MongoDBManager:
             return False
         try:
             result = self.menu.replace_one({}, menu_data)
+            self.invalidate_menu_cache()
             return result.modified_count > 0
         except Exception as e:
             print(f"Error updating menu: {e}")
@@ -286,16 +380,7 @@ class MongoDBManager:
     # ===== Restaurant Info =====
     def get_restaurant_info(self) -> Dict[str, Any]:
         """Static restaurant information (not in DB)"""
-        return {
-            "name": "Les Pieds dans le Plat",
-            "address": "1 Avenue des Champs-Élysées, 75008 Paris, France",
-            "phone": "+33 1 23 45 67 89",
-            "email": "contact@lespiedsdansleplat.fr",
-            "openingHours": "11:00 AM - 01:00 AM",
-            "description": "Un restaurant traditionnel français au cœur de Paris, offrant une cuisine raffinée dans une ambiance chaleureuse.",
-            "website": "https://www.lespiedsdansleplat.fr",
-            "location": {"latitude": 48.8700, "longitude": 2.3050}
-        }
+        return RESTAURANT_INFO
     
     # ===== Close Connection =====
     def close(self):
@@ -1,7 +1,14 @@
-from .info_agent import create_info_agent
-from .order_agent import create_order_agent
-from .reservation_agent import create_reservation_agent
-from .supervisor import create_supervisor_agent, ConversationState
+import importlib
+
+# Agent modules pull in LangChain and the Mistral client, so they are only
+# imported the first time one of their names is accessed.
+_LAZY_IMPORTS = {
+    "ConversationState": ".supervisor",
+    "create_info_agent": ".info_agent",
+    "create_order_agent": ".order_agent",
+    "create_reservation_agent": ".reservation_agent",
+    "create_supervisor_agent": ".supervisor",
+}
 
 __all__ = [
     "ConversationState",
@@ -9,4 +16,16 @@ __all__ = [
     "create_order_agent",
     "create_reservation_agent",
     "create_supervisor_agent",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,19 +1,12 @@
 from langchain.agents import create_agent
 from langchain.tools import tool
-from langchain_mistralai import ChatMistralAI
 from typing import Optional, List, Dict, Any
-from datetime import datetime
 
 from data.mongodb import MongoDBManager
-from pathseeker import PROMPTS_DIR
 from utils.logger import log_execution
-
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-MISTRAL_API_KEY = os.environ.get("MISTRAL_API_KEY")
+from utils.prompts import load_prompt
+from models.agents.llm import get_mistral_model
+from models.agents.middleware import current_datetime_prompt
 
 def create_info_agent(db: MongoDBManager):
     """Create and return the info agent."""
@@ -25,6 +18,16 @@ def create_info_agent(db: MongoDBManager):
         """Get all dishes from the menu."""
         return db.get_all_dishes()
     
+    @tool("search_dishes")
+    @log_execution(message="Searching dishes", object_name="agent_info")
+    def search_dishes(query: str) -> List[Dict[str, Any]]:
+        """Search dishes whose name, category, ingredients or allergen types match the query.
+        
+        Args:
+            query: Text to look for (e.g. 'salmon', 'dessert', 'gluten')
+        """
+        return db.search_dishes(query)
+    
     @tool("get_dishes_by_category")
     @log_execution(message="Fetching dishes grouped by category", object_name="agent_info")
     def get_dishes_by_category() -> Dict[str, List[Dict[str, Any]]]:
@@ -45,26 +48,16 @@ def create_info_agent(db: MongoDBManager):
 
 
     # --- Create agent ---
-    model = ChatMistralAI(
-        mistral_api_key=MISTRAL_API_KEY,
-        model='mistral-medium-latest',
-        max_retries=2
-    )
+    model = get_mistral_model()
 
-    prompt_path = PROMPTS_DIR / "info_agent_prompt.txt"
-    with open(prompt_path, "r") as f:
-        system_prompt = f.read()
-        f.close()
-    
-    # Add current date and time to the prompt
-    current_datetime = datetime.now().strftime("%A, %B %d, %Y at %H:%M")
-    system_prompt = f"CURRENT DATE AND TIME: {current_datetime}\n\n{system_prompt}"
+    system_prompt = load_prompt("info_agent_prompt.txt")
 
     info_agent = create_agent(
         model=model,
-        system_prompt=system_prompt,
+        middleware=[current_datetime_prompt(system_prompt)],
         tools=[
             get_all_dishes,
+            search_dishes,
             get_dishes_by_category,
             get_formulas,
             get_restaurant_info,
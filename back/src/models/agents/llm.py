@@ -0,0 +1,20 @@
+from langchain_mistralai import ChatMistralAI
+
+import functools
+
+from settings import MISTRAL_API_KEY, MISTRAL_MODEL
+
+
+@functools.lru_cache(maxsize=4)
+def get_mistral_model(model: str = MISTRAL_MODEL) -> ChatMistralAI:
+    """
+    Return the shared ChatMistralAI client for the given model.
+
+    The chat model holds no conversation state, so every agent can reuse the
+    same instance and its underlying HTTP connection pool.
+    """
+    return ChatMistralAI(
+        mistral_api_key=MISTRAL_API_KEY,
+        model=model,
+        max_retries=2
+    )
@@ -0,0 +1,18 @@
+from langchain.agents.middleware import dynamic_prompt, ModelRequest
+from datetime import datetime
+
+
+def current_datetime_prompt(system_prompt: str):
+    """
+    Build a middleware that sends `system_prompt` followed by the current date and time.
+
+    The static prompt stays first and byte-identical on every call so the
+    provider can reuse its prefix; only the trailing timestamp changes, and it
+    is computed per model call instead of once when the agent is created.
+    """
+    @dynamic_prompt
+    def prompt_with_datetime(request: ModelRequest) -> str:
+        current_datetime = datetime.now().strftime("%A, %B %d, %Y at %H:%M")
+        return f"{system_prompt}\n\nCURRENT DATE AND TIME: {current_datetime}"
+
+    return prompt_with_datetime
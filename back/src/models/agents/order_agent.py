@@ -1,20 +1,13 @@
 from langchain.agents import create_agent
 from langchain.tools import tool
-from langchain_mistralai import ChatMistralAI
 from typing import Optional, List, Dict, Any
-from datetime import datetime
 
 from data.mongodb import MongoDBManager
 from data.table_schemas import OrderSchema
-from pathseeker import PROMPTS_DIR
 from utils.logger import log_execution, log_function_execution
-
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-MISTRAL_API_KEY = os.environ.get("MISTRAL_API_KEY")
+from utils.prompts import load_prompt
+from models.agents.llm import get_mistral_model
+from models.agents.middleware import current_datetime_prompt
 
 def create_order_agent(db: MongoDBManager):
     """Create and return the order agent."""
@@ -26,6 +19,16 @@ def create_order_agent(db: MongoDBManager):
         """Get all dishes from the menu."""
         return db.get_all_dishes()
 
+    @tool("search_dishes")
+    @log_execution(message="Searching dishes", object_name="agent_order")
+    def search_dishes(query: str) -> List[Dict[str, Any]]:
+        """Search dishes whose name, category, ingredients or allergen types match the query.
+        
+        Args:
+            query: Text to look for (e.g. 'salmon', 'dessert', 'gluten')
+        """
+        return db.search_dishes(query)
+
     @tool("get_formulas")
     @log_execution(message="Fetching special formulas", object_name="agent_order")
     def get_formulas() -> Optional[Dict[str, Any]]:
@@ -74,26 +77,16 @@ def create_order_agent(db: MongoDBManager):
         return db.cancel_order(order_id)
 
     # --- Create agent ---
-    model = ChatMistralAI(
-        mistral_api_key=MISTRAL_API_KEY,
-        model='mistral-medium-latest',
-        max_retries=2
-    )
+    model = get_mistral_model()
 
-    prompt_path = PROMPTS_DIR / "order_agent_prompt.txt"
-    with open(prompt_path, "r") as f:
-        system_prompt = f.read()
-        f.close()
-    
-    # Add current date and time to the prompt
-    current_datetime = datetime.now().strftime("%A, %B %d, %Y at %H:%M")
-    system_prompt = f"CURRENT DATE AND TIME: {current_datetime}\n\n{system_prompt}"
+    system_prompt = load_prompt("order_agent_prompt.txt")
 
     order_agent = create_agent(
         model=model,
-        system_prompt=system_prompt,
+        middleware=[current_datetime_prompt(system_prompt)],
         tools=[
             get_all_dishes,
+            search_dishes,
             get_formulas,
             get_orders,
             create_order,
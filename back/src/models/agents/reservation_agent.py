@@ -1,20 +1,13 @@
 from langchain.agents import create_agent
 from langchain.tools import tool
-from langchain_mistralai import ChatMistralAI
 from typing import Optional, List, Dict, Any
-from datetime import datetime
 
 from data.mongodb import MongoDBManager
 from data.table_schemas import TableSchema, ReservationSchema
-from pathseeker import PROMPTS_DIR
 from utils.logger import log_execution
-
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-MISTRAL_API_KEY = os.environ.get("MISTRAL_API_KEY")
+from utils.prompts import load_prompt
+from models.agents.llm import get_mistral_model
+from models.agents.middleware import current_datetime_prompt
 
 def create_reservation_agent(db: MongoDBManager):
     """Create and return the reservation agent."""
@@ -68,24 +61,13 @@ def create_reservation_agent(db: MongoDBManager):
         return db.cancel_reservation(reservation_id)
 
     # --- Create agent ---
-    model = ChatMistralAI(
-        mistral_api_key=MISTRAL_API_KEY,
-        model='mistral-medium-latest',
-        max_retries=2
-    )
+    model = get_mistral_model()
 
-    prompt_path = PROMPTS_DIR / "reservation_agent_prompt.txt"
-    with open(prompt_path, "r") as f:
-        system_prompt = f.read()
-        f.close()
-    
-    # Add current date and time to the prompt
-    current_datetime = datetime.now().strftime("%A, %B %d, %Y at %H:%M")
-    system_prompt = f"CURRENT DATE AND TIME: {current_datetime}\n\n{system_prompt}"
+    system_prompt = load_prompt("reservation_agent_prompt.txt")
 
     reservation_agent = create_agent(
         model=model,
-        system_prompt=system_prompt,
+        middleware=[current_datetime_prompt(system_prompt)],
         tools=[
             get_reservations,
             get_tables,
@@ -1,35 +1,58 @@
 from langchain.agents import create_agent
 from langchain.tools import tool
 from langchain_mistralai import ChatMistralAI
+from collections import deque
+import threading
 
 from models.agents import create_info_agent, create_order_agent, create_reservation_agent
 from data.mongodb import MongoDBManager
-from pathseeker import PROMPTS_DIR
 from settings import AVAILABLE_VOICES
 from utils.logger import log_execution
-
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-MISTRAL_API_KEY = os.environ.get("MISTRAL_API_KEY")
+from utils.prompts import load_prompt
+from models.agents.llm import get_mistral_model
+
+# The supervisor prompt only depends on static files/settings, so it is built once at import
+SUPERVISOR_SYSTEM_PROMPT = (
+    load_prompt("supervisor_prompt.txt")
+    + "\nYou only support the languages corresponding to the following voices codes: " + ", ".join(AVAILABLE_VOICES)
+    + "\nIf you receive a request in a language you do not support, respond in **ENGLISH**."
+)
+
+# Messages kept per sub-agent (user/assistant pairs); older turns are dropped so
+# the prompt sent on every invoke stays bounded
+MAX_HISTORY_MESSAGES = 20
+
+def _make_room(history: deque):
+    """Drop whole exchanges from the front so a new user/assistant pair fits and the history still starts with a user turn"""
+    while len(history) > MAX_HISTORY_MESSAGES - 2:
+        history.popleft()
+    while history and history[0]["role"] != "user":
+        history.popleft()
 
 # Global state to track which agent is currently handling the conversation
 class ConversationState:
+    __slots__ = ("active_agent", "conversation_history", "history_locks")
+
     def __init__(self):
         self.active_agent = None  # None, 'info', 'order', or 'reservation'
+        # Parallel tool calls run in separate threads: each lock serialises one
+        # sub-agent's append/invoke/append so its history stays in user/assistant order
+        self.history_locks = {
+            'info': threading.Lock(),
+            'order': threading.Lock(),
+            'reservation': threading.Lock()
+        }
         self.conversation_history = {
-            'info': [],
-            'order': [],
-            'reservation': []
+            'info': deque(),
+            'order': deque(),
+            'reservation': deque()
         }
     
     def clear_history(self):
         self.conversation_history = {
-            'info': [],
-            'order': [],
-            'reservation': []
+            'info': deque(),
+            'order': deque(),
+            'reservation': deque()
         }
         self.active_agent = None
 
@@ -53,14 +76,16 @@ def create_supervisor_agent(db: MongoDBManager, conversation_state: Conversation
             request: Natural language request from the user (e.g., 'Where is the restaurant located?', 'Which dishes are vegan?')
         """
         conversation_state.active_agent = 'info'
-        conversation_state.conversation_history['info'].append({"role": "user", "content": request})
+        with conversation_state.history_locks['info']:
+            _make_room(conversation_state.conversation_history['info'])
+            conversation_state.conversation_history['info'].append({"role": "user", "content": request})
         
-        response = info_agent.invoke({
-            "messages": conversation_state.conversation_history['info']
-        })
+            response = info_agent.invoke({
+                "messages": list(conversation_state.conversation_history['info'])
+            })
         
-        assistant_message = response["messages"][-1].text
-        conversation_state.conversation_history['info'].append({"role": "assistant", "content": assistant_message})
+            assistant_message = response["messages"][-1].text
+            conversation_state.conversation_history['info'].append({"role": "assistant", "content": assistant_message})
         
         return f"Response of the info_agent:\n{assistant_message}"
 
@@ -76,14 +101,16 @@ def create_supervisor_agent(db: MongoDBManager, conversation_state: Conversation
             request: Natural language request from the user (e.g., 'I want to order a pizza', 'Can I change my order?')
         """
         conversation_state.active_agent = 'order'
-        conversation_state.conversation_history['order'].append({"role": "user", "content": request})
+        with conversation_state.history_locks['order']:
+            _make_room(conversation_state.conversation_history['order'])
+            conversation_state.conversation_history['order'].append({"role": "user", "content": request})
         
-        response = order_agent.invoke({
-            "messages": conversation_state.conversation_history['order']
-        })
+            response = order_agent.invoke({
+                "messages": list(conversation_state.conversation_history['order'])
+            })
         
-        assistant_message = response["messages"][-1].text
-        conversation_state.conversation_history['order'].append({"role": "assistant", "content": assistant_message})
+            assistant_message = response["messages"][-1].text
+            conversation_state.conversation_history['order'].append({"role": "assistant", "content": assistant_message})
         
         return f"Response of the order_agent:\n{assistant_message}"
     
@@ -99,35 +126,25 @@ def create_supervisor_agent(db: MongoDBManager, conversation_state: Conversation
             request: Natural language request from the user (e.g., 'I want to book a table for two today', 'Can I change my reservation time?')
         """
         conversation_state.active_agent = 'reservation'
-        conversation_state.conversation_history['reservation'].append({"role": "user", "content": request})
+        with conversation_state.history_locks['reservation']:
+            _make_room(conversation_state.conversation_history['reservation'])
+            conversation_state.conversation_history['reservation'].append({"role": "user", "content": request})
         
-        response = reservation_agent.invoke({
-            "messages": conversation_state.conversation_history['reservation']
-        })
+            response = reservation_agent.invoke({
+                "messages": list(conversation_state.conversation_history['reservation'])
+            })
         
-        assistant_message = response["messages"][-1].text
-        conversation_state.conversation_history['reservation'].append({"role": "assistant", "content": assistant_message})
+            assistant_message = response["messages"][-1].text
+            conversation_state.conversation_history['reservation'].append({"role": "assistant", "content": assistant_message})
         
         return f"Response of the reservation_agent:\n{assistant_message}"
 
     # --- Create agent ---
-    model = ChatMistralAI(
-        mistral_api_key=MISTRAL_API_KEY,
-        model='mistral-medium-latest',
-        max_retries=2
-    )
-
-    prompt_path = PROMPTS_DIR / "supervisor_prompt.txt"
-    with open(prompt_path, "r") as f:
-        system_prompt = f.read()
-        f.close()
-
-    system_prompt += "\nYou only support the languages corresponding to the following voices codes: " + ", ".join(AVAILABLE_VOICES)
-    system_prompt += "\nIf you receive a request in a language you do not support, respond in **ENGLISH**."
+    model = get_mistral_model()
 
     supervisor = create_agent(
         model=model,
-        system_prompt=system_prompt,
+        system_prompt=SUPERVISOR_SYSTEM_PROMPT,
         tools=[
             info_event,
             order_event,
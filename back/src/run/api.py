@@ -8,6 +8,7 @@ import base64
 import json
 import os
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 from utils.logger import log_function_execution
@@ -32,11 +33,17 @@ socket = SocketIO(
 )
 
 # Initialize models and agents
+# Whisper, the Piper voices and the agents are independent and mostly wait on
+# disk/network, so they are loaded concurrently to cut startup time.
 db = MongoDBManager()
-stt_model = WhisperWrapper()
-tts_engine = TTSEngine()
 conversation_state = ConversationState()
-supervisor_agent = create_supervisor_agent(db, conversation_state)
+with ThreadPoolExecutor(max_workers=3) as executor:
+    stt_future = executor.submit(WhisperWrapper)
+    tts_future = executor.submit(TTSEngine)
+    supervisor_future = executor.submit(create_supervisor_agent, db, conversation_state)
+    stt_model = stt_future.result()
+    tts_engine = tts_future.result()
+    supervisor_agent = supervisor_future.result()
 
 @app.route('/health', methods=['GET'])
 def health_check():
@@ -64,7 +71,6 @@ def synthesize_speech(data):
     messages = data['messages']
     language = data['language']
     print(f"Generating LLM response with language: {language}")
-    print(f"Messages received: {messages}")
     start = time.time()
     llm_response = supervisor_agent.invoke({"messages": messages})['messages'][-1].content
     end = time.time()
@@ -77,7 +83,6 @@ def synthesize_speech(data):
     print(f"Starting TTS generation for language: {language}")
     start_tts = time.time()
     for audio_chunk, sample_rate in tts_engine.stream_speech(language, llm_response):
-        print(f"Generated audio chunk: {len(audio_chunk)} samples at {sample_rate}Hz")
         audio_bytes = audio_chunk.tobytes()
         audio_b64 = base64.b64encode(audio_bytes).decode('utf-8')
         emit('llm_audio_chunk', {'audio': audio_b64, 'sample_rate': sample_rate})
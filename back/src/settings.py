@@ -1,3 +1,26 @@
+import os
+from dotenv import load_dotenv
+
+# The .env file is parsed once, here; other modules import the values below.
+load_dotenv()
+
+def _optional_int(name: str):
+    value = os.environ.get(name)
+    return int(value) if value else None
+
+# ===== MongoDB =====
+MONGODB_URI = os.environ.get("MONGODB_URI", "mongodb://localhost:27017")
+MONGODB_DB_NAME = os.environ.get("MONGODB_DB_NAME", "Restaurant_DB")
+# Pool tuning is opt-in: unset values keep the PyMongo defaults
+MONGODB_MAX_POOL_SIZE = _optional_int("MONGODB_MAX_POOL_SIZE")
+MONGODB_MIN_POOL_SIZE = _optional_int("MONGODB_MIN_POOL_SIZE")
+MONGODB_WAIT_QUEUE_TIMEOUT_MS = _optional_int("MONGODB_WAIT_QUEUE_TIMEOUT_MS")
+
+# ===== Mistral =====
+MISTRAL_API_KEY = os.environ.get("MISTRAL_API_KEY")
+MISTRAL_MODEL = "mistral-medium-latest"
+
+# ===== Voices =====
 VOICES_CONFIG = {
     "ar": { # Arabic
         "voice_name": "ar_JO-kareem-medium",
@@ -89,12 +89,12 @@ def log_execution(func=None, *, message=None, object_name=None):
         def my_function(): pass
     """
     def decorator(f):
+        # Prepare log information once, not on every call
+        func_name = f.__name__
+        msg = message if message else f"Function '{func_name}' executed"
+
         @functools.wraps(f)
         def wrapper(*args, **kwargs):
-            # Prepare log information
-            func_name = f.__name__
-            msg = message if message else f"Function '{func_name}' executed"
-            
             # Execute function and measure time
             start_time = time.time()
             try:
@@ -0,0 +1,20 @@
+from pathseeker import PROMPTS_DIR
+
+# Prompt files do not change while the server is running, so they are all read
+# once when this module is first imported.
+_PROMPTS = {
+    path.name: path.read_text(encoding="utf-8")
+    for path in PROMPTS_DIR.glob("*.txt")
+}
+
+
+def load_prompt(filename: str) -> str:
+    """
+    Return the content of a system prompt from the prompts directory.
+
+    Args:
+        filename (str): Name of the prompt file inside PROMPTS_DIR
+    """
+    if filename not in _PROMPTS:
+        raise FileNotFoundError(f"No prompt file '{filename}' in {PROMPTS_DIR}")
+    return _PROMPTS[filename]